@@ -1,21 +1,50 @@
-import requests
-from bs4 import BeautifulSoup
 import re
 import pandas as pd
-import time
-import random
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 import json
 import os
 import yaml
+import threading
+import functools
+import html
+from contextlib import contextmanager
+from datetime import timedelta
+from urllib.parse import urlencode, quote
+from concurrent.futures import ThreadPoolExecutor, Future
 
 from utils.email_utils import EmailExtractor
-from utils.web_utils import WebsiteAnalyzer
+from utils.web_utils import WebsiteAnalyzer, RateLimiter, create_session, throttled_get
 from utils.export_utils import DataExporter
+from utils.driver_utils import DriverPool, build_driver
+
+# Reads the basic profile fields in the page instead of one find_element call per field
+_PROFILE_FIELDS_JS = """
+const text = (selector) => (document.querySelector(selector) || {}).innerText || null;
+return {
+    name: text('.pv-top-card--list .text-heading-xlarge'),
+    title: text('.pv-top-card--list .text-body-medium'),
+    company: text('.pv-top-card--experience-list-item .pv-entity__secondary-title'),
+    location: text('.pv-top-card--list-bullet .t-16')
+};
+"""
+
+# href of the first link inside Google's first ".yuRUbf" result container;
+# the span may not run past a closing </div> or another link
+_GOOGLE_FIRST_RESULT_RE = re.compile(
+    rb'<div[^>]*class="[^"]*\byuRUbf\b[^"]*"[^>]*>(?:(?!</div>|<a\s).)*<a\s[^>]*?href="([^"]*)"',
+    re.DOTALL
+)
+
+def _with_driver(method):
+    """Run a scraper method with a pooled WebDriver checked out for the current thread."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._use_driver():
+            return method(self, *args, **kwargs)
+    return wrapper
 
 class LinkedInLeadScraper:
     """
@@ -35,50 +64,123 @@ class LinkedInLeadScraper:
         Args:
             config_file (str, optional): Path to YAML configuration file
         """
-        # Load config if provided
-        self.config = {}
-        if config_file and os.path.exists(config_file):
-            with open(config_file, 'r') as f:
-                self.config = yaml.safe_load(f)
+        # Load config if provided; copied so per-instance changes don't leak into the cache
+        self.config = dict(self._load_config(config_file))
         
         # Set default headers
         self.headers = {
             'User-Agent': self.config.get('user_agent', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
         }
         
+        # Shared HTTP session so connections are reused across requests
+        cache_name = self.config.get('cache_name', '.lead_cache') if self.config.get('use_cache', True) else None
+        self.session = create_session(
+            self.headers,
+            cache_name=cache_name,
+            expire_after=timedelta(days=self.config.get('cache_ttl_days', 7))
+        )
+        
+        # Global request budget shared by HTTP requests and browser navigations
+        self.rate_limiter = RateLimiter(max_calls=self.config.get('qps', 2), period=1)
+        
         # Initialize data storage
         self.leads_data = []
         
         # Initialize utilities
         self.email_extractor = EmailExtractor()
-        self.website_analyzer = WebsiteAnalyzer(self.headers)
+        self.website_analyzer = WebsiteAnalyzer(self.headers, session=self.session, rate_limiter=self.rate_limiter)
         self.data_exporter = DataExporter()
         
-        # Set up Selenium WebDriver
-        self.setup_driver()
+        # Company website lookups (as Futures), keyed by normalized company name
+        self._company_site_cache = {}
+        self._company_site_lock = threading.Lock()
+        
+        # WebDriver is not thread-safe, so each thread checks one out of a shared pool
+        self._local = threading.local()
+        self.driver_pool = DriverPool(
+            size=self.config.get('workers', 4),
+            driver_factory=self.setup_driver,
+            recycle_after=self.config.get('recycle_after', 50),
+            acquire_timeout=self.config.get('driver_acquire_timeout', 300)
+        )
         
-    def setup_driver(self):
-        """Set up the Selenium WebDriver with appropriate options."""
-        chrome_options = Options()
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _load_config(config_file):
+        """
+        Read a YAML configuration file, caching the result per path.
         
-        # Apply headless mode if configured
-        if self.config.get('headless', True):
-            chrome_options.add_argument("--headless")
+        Args:
+            config_file (str): Path to YAML configuration file
             
-        # Add standard options
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        
-        # Add any custom options from config
-        for option in self.config.get('chrome_options', []):
-            chrome_options.add_argument(option)
+        Returns:
+            dict: Configuration, empty if the file is missing
+        """
+        if not config_file or not os.path.exists(config_file):
+            return {}
+            
+        with open(config_file, 'r') as f:
+            return yaml.safe_load(f) or {}
+        
+    @property
+    def driver(self):
+        """Selenium WebDriver checked out by the current thread, or None."""
+        return getattr(self._local, 'driver', None)
+        
+    @contextmanager
+    def _use_driver(self):
+        """Check a driver out of the pool for the current thread, unless it already holds one."""
+        if self.driver is not None:
+            yield self.driver
+            return
             
-        # Initialize the driver
-        self.driver = webdriver.Chrome(options=chrome_options)
+        with self.driver_pool.driver() as driver:
+            self._local.driver = driver
+            try:
+                yield driver
+            finally:
+                self._local.driver = None
         
-        # Set default timeout
-        self.driver.implicitly_wait(self.config.get('timeout', 10))
+    def setup_driver(self):
+        """
+        Create a Selenium WebDriver with appropriate options.
+        
+        Returns:
+            WebDriver: New Chrome driver
+        """
+        return build_driver(self.config)
+        
+    def _navigate(self, url):
+        """
+        Load a URL in the current thread's driver, within the rate limit.
+        
+        Args:
+            url (str): URL to load
+        """
+        with self.rate_limiter:
+            self.driver.get(url)
+        self.driver_pool.record_page(self.driver)
         
+    def _wait_for(self, selector, timeout=None):
+        """
+        Wait until an element matching a CSS selector is present.
+        
+        Args:
+            selector (str): CSS selector to wait for
+            timeout (int, optional): Seconds to wait, defaults to the configured timeout
+            
+        Returns:
+            bool: True if the element appeared before the timeout
+        """
+        try:
+            WebDriverWait(self.driver, timeout or self.config.get('timeout', 10)).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+            )
+            return True
+        except TimeoutException:
+            return False
+        
+    @_with_driver
     def search_linkedin(self, keywords, location=None, industry=None, company_size=None, limit=10):
         """
         Search LinkedIn for profiles matching the given criteria.
@@ -96,60 +198,92 @@ class LinkedInLeadScraper:
         print(f"Searching LinkedIn for: {keywords}")
         
         # Construct search URL with parameters
-        search_url = f"https://www.linkedin.com/search/results/people/?keywords={keywords.replace(' ', '%20')}"
-        if location:
-            search_url += f"&location={location.replace(' ', '%20')}"
-        if industry:
-            search_url += f"&industry={industry.replace(' ', '%20')}"
-        if company_size:
-            search_url += f"&companySize={company_size.replace(' ', '%20')}"
+        params = {
+            name: value for name, value in [
+                ('keywords', keywords),
+                ('location', location),
+                ('industry', industry),
+                ('companySize', company_size)
+            ] if value
+        }
+        search_url = "https://www.linkedin.com/search/results/people/?" + urlencode(params, quote_via=quote)
             
         # Navigate to search page
-        self.driver.get(search_url)
+        self._navigate(search_url)
         
         # Check if login is required
         if "login" in self.driver.current_url or "signup" in self.driver.current_url:
             raise Exception("LinkedIn login required. Please add authentication handling.")
             
         # Wait for search results to load
-        time.sleep(self.config.get('search_delay', 2))
+        self._wait_for(".search-result__info .search-result__result-link")
         
-        # Extract profile links
-        profile_elements = self.driver.find_elements(By.CSS_SELECTOR, ".search-result__info .search-result__result-link")
+        # Read profile URLs now; the elements go stale once the next page loads
+        profile_urls = []
+        profile_elements = self._read_profile_urls(profile_urls)
         
         # Handle pagination if needed and configured
-        if len(profile_elements) < limit and self.config.get('use_pagination', True):
+        if len(profile_urls) < limit and self.config.get('use_pagination', True):
             pages_to_check = min(limit // 10 + 1, self.config.get('max_pages', 5))
             
             for page in range(2, pages_to_check + 1):
                 # Click next page or navigate to next page URL
                 try:
                     next_button = self.driver.find_element(By.CSS_SELECTOR, "button.artdeco-pagination__button--next")
-                    next_button.click()
-                    time.sleep(self.config.get('pagination_delay', 2))
+                except NoSuchElementException:
+                    break
                     
-                    # Get additional profile elements
-                    additional_elements = self.driver.find_elements(By.CSS_SELECTOR, ".search-result__info .search-result__result-link")
-                    profile_elements.extend(additional_elements)
+                try:
+                    with self.rate_limiter:
+                        next_button.click()
+                    self.driver_pool.record_page(self.driver)
+                except WebDriverException as e:
+                    print(f"Could not open search results page {page}: {e}")
+                    break
                     
-                    # Break if we have enough profiles
-                    if len(profile_elements) >= limit:
+                # Wait for the previous page's results to be replaced
+                if profile_elements:
+                    try:
+                        WebDriverWait(self.driver, self.config.get('timeout', 10)).until(EC.staleness_of(profile_elements[-1]))
+                    except TimeoutException:
+                        print(f"Search results did not change after requesting page {page}; stopping pagination")
                         break
-                except:
+                self._wait_for(".search-result__info .search-result__result-link")
+                
+                profile_elements = self._read_profile_urls(profile_urls)
+                
+                # Break if we have enough profiles
+                if len(profile_urls) >= limit:
                     break
+                    
+        return profile_urls[:limit]
+    
+    def _read_profile_urls(self, profile_urls):
+        """
+        Append the profile URLs on the current search results page.
         
-        # Extract profile URLs
-        profile_urls = []
-        for element in profile_elements[:limit]:
+        Args:
+            profile_urls (list): URLs collected so far; duplicates are skipped
+            
+        Returns:
+            list: Result link elements read from the page
+        """
+        profile_elements = self.driver.find_elements(By.CSS_SELECTOR, ".search-result__info .search-result__result-link")
+        
+        for element in profile_elements:
             try:
                 href = element.get_attribute("href")
-                if href and "/in/" in href:
-                    profile_urls.append(href.split("?")[0])  # Remove query parameters
-            except:
+            except WebDriverException:
                 continue
                 
-        return profile_urls
+            if href and "/in/" in href:
+                url = href.split("?")[0]  # Remove query parameters
+                if url not in profile_urls:
+                    profile_urls.append(url)
+                    
+        return profile_elements
     
+    @_with_driver
     def extract_linkedin_profile(self, profile_url):
         """
         Extract information from a LinkedIn profile.
@@ -163,13 +297,10 @@ class LinkedInLeadScraper:
         print(f"Extracting data from: {profile_url}")
         
         # Navigate to profile page
-        self.driver.get(profile_url)
+        self._navigate(profile_url)
         
-        # Add random delay to avoid detection
-        time.sleep(random.uniform(
-            self.config.get('min_delay', 2),
-            self.config.get('max_delay', 4)
-        ))
+        # Wait for the profile header to render
+        self._wait_for(".pv-top-card--list .text-heading-xlarge")
         
         # Initialize profile data dictionary
         profile_data = {
@@ -182,31 +313,13 @@ class LinkedInLeadScraper:
             "email": None
         }
         
-        # Extract basic profile information
-        try:
-            profile_data["name"] = self.driver.find_element(By.CSS_SELECTOR, ".pv-top-card--list .text-heading-xlarge").text
-        except:
-            pass
-            
-        try:
-            profile_data["title"] = self.driver.find_element(By.CSS_SELECTOR, ".pv-top-card--list .text-body-medium").text
-        except:
-            pass
-            
+        # Extract basic profile information in a single WebDriver round-trip
         try:
-            profile_data["company"] = self.driver.find_element(By.CSS_SELECTOR, ".pv-top-card--experience-list-item .pv-entity__secondary-title").text
+            fields = self.driver.execute_script(_PROFILE_FIELDS_JS) or {}
+            profile_data.update({field: value.strip() for field, value in fields.items() if value and value.strip()})
         except:
             pass
             
-        try:
-            profile_data["location"] = self.driver.find_element(By.CSS_SELECTOR, ".pv-top-card--list-bullet .t-16").text
-        except:
-            pass
-            
-        # Find company website if available
-        if profile_data["company"] != "Unknown":
-            profile_data["company_website"] = self.find_company_website(profile_data["company"])
-        
         # Extract email using pattern matching
         profile_data["email"] = self.email_extractor.extract_email_from_text(self.driver.page_source)
         
@@ -237,24 +350,54 @@ class LinkedInLeadScraper:
         except:
             pass
         
+        # Find company website if available; this may navigate the driver away
+        # from the profile, so it runs after everything read from the profile page
+        if profile_data["company"] != "Unknown":
+            profile_data["company_website"] = self.find_company_website(profile_data["company"])
+            
         return profile_data
     
     def find_company_website(self, company_name):
         """
         Find company website using search engine.
         
+        Results, including misses, are cached per company name for the
+        lifetime of the scraper. Concurrent calls for the same company wait
+        for the first lookup instead of repeating it.
+        
         Args:
             company_name (str): Company name
             
         Returns:
             str: Company website URL or None
         """
+        key = company_name.strip().lower()
+        with self._company_site_lock:
+            future = self._company_site_cache.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._company_site_cache[key] = future
+                
+        if is_owner:
+            try:
+                future.set_result(self._lookup_company_website(company_name))
+            except Exception as e:
+                # Don't cache failures; the next caller retries the lookup
+                with self._company_site_lock:
+                    del self._company_site_cache[key]
+                future.set_exception(e)
+                
+        return future.result()
+    
+    @_with_driver
+    def _lookup_company_website(self, company_name):
+        """Look up a company website on LinkedIn, falling back to Google."""
         # Try LinkedIn company search first if configured
         if self.config.get('use_linkedin_company_search', True):
             try:
                 company_search_url = f"https://www.linkedin.com/company/{company_name.lower().replace(' ', '-')}/"
-                self.driver.get(company_search_url)
-                time.sleep(1)
+                self._navigate(company_search_url)
                 
                 # Check if we landed on a company page
                 if "/company/" in self.driver.current_url and not "search" in self.driver.current_url:
@@ -268,19 +411,18 @@ class LinkedInLeadScraper:
                 pass
         
         # Fall back to search engine
-        search_url = f"https://www.google.com/search?q={company_name.replace(' ', '+')}+official+website"
+        search_url = "https://www.google.com/search?" + urlencode({'q': f"{company_name} official website"})
         
         try:
-            response = requests.get(search_url, headers=self.headers, timeout=self.config.get('request_timeout', 10))
-            soup = BeautifulSoup(response.text, 'html.parser')
+            response = throttled_get(self.session, self.rate_limiter, search_url, timeout=self.config.get('request_timeout', 10))
             
-            # Extract the first search result
-            search_results = soup.select(".yuRUbf a")
-            if search_results:
-                website_url = search_results[0].get("href")
+            # Extract the first search result without parsing the whole page
+            match = _GOOGLE_FIRST_RESULT_RE.search(response.content)
+            if match:
+                website_url = html.unescape(match.group(1).decode('utf-8', 'ignore'))
                 
                 # Basic validation of URL
-                if website_url and website_url.startswith("http"):
+                if website_url.startswith("http"):
                     return website_url
         except Exception as e:
             print(f"Error finding company website: {e}")
@@ -318,44 +460,56 @@ class LinkedInLeadScraper:
         """
         profile_urls = self.search_linkedin(keywords, location, industry, company_size, limit)
         
-        leads = []
-        for url in profile_urls:
-            try:
-                # Extract LinkedIn profile data
-                profile_data = self.extract_linkedin_profile(url)
-                
-                # Extract company website information if available
-                if profile_data["company_website"]:
-                    contact_info = self.extract_contact_info_from_website(profile_data["company_website"])
-                    
-                    # Merge contact info into profile data
-                    if contact_info.get("emails") and not profile_data["email"]:
-                        profile_data["email"] = contact_info["emails"][0]
-                    
-                    profile_data["additional_emails"] = contact_info.get("emails", [])
-                    profile_data["phone_numbers"] = contact_info.get("phone_numbers", [])
-                    profile_data["social_media"] = contact_info.get("social_media", {})
-                    
-                    # Try to generate email if still not found
-                    if not profile_data["email"] and profile_data["name"] != "Unknown":
-                        generated_email = self.email_extractor.generate_likely_email(
-                            profile_data["name"], 
-                            profile_data["company"],
-                            profile_data["company_website"],
-                            contact_info.get("emails", [])
-                        )
-                        if generated_email:
-                            profile_data["email"] = generated_email
-                            profile_data["email_confidence"] = "Generated"
-                
-                leads.append(profile_data)
-            except Exception as e:
-                print(f"Error processing profile {url}: {e}")
-                continue
+        # Enrich profiles concurrently; results keep the search order
+        with ThreadPoolExecutor(max_workers=self.config.get('workers', 4)) as executor:
+            leads = [lead for lead in executor.map(self._enrich, profile_urls) if lead]
             
         self.leads_data = leads
         return leads
     
+    def _enrich(self, url):
+        """
+        Build a lead from a LinkedIn profile URL.
+        
+        Args:
+            url (str): LinkedIn profile URL
+            
+        Returns:
+            dict or None: Lead data, or None if the profile could not be processed
+        """
+        try:
+            # Extract LinkedIn profile data
+            profile_data = self.extract_linkedin_profile(url)
+            
+            # Extract company website information if available
+            if profile_data["company_website"]:
+                contact_info = self.extract_contact_info_from_website(profile_data["company_website"])
+                
+                # Merge contact info into profile data
+                if contact_info.get("emails") and not profile_data["email"]:
+                    profile_data["email"] = contact_info["emails"][0]
+                
+                profile_data["additional_emails"] = contact_info.get("emails", [])
+                profile_data["phone_numbers"] = contact_info.get("phone_numbers", [])
+                profile_data["social_media"] = contact_info.get("social_media", {})
+                
+                # Try to generate email if still not found
+                if not profile_data["email"] and profile_data["name"] != "Unknown":
+                    generated_email = self.email_extractor.generate_likely_email(
+                        profile_data["name"], 
+                        profile_data["company"],
+                        profile_data["company_website"],
+                        contact_info.get("emails", [])
+                    )
+                    if generated_email:
+                        profile_data["email"] = generated_email
+                        profile_data["email_confidence"] = "Generated"
+            
+            return profile_data
+        except Exception as e:
+            print(f"Error processing profile {url}: {e}")
+            return None
+    
     def export_to_csv(self, filename="leads_data.csv"):
         """Export leads data to CSV."""
         return self.data_exporter.export_to_csv(self.leads_data, filename)
@@ -369,8 +523,9 @@ class LinkedInLeadScraper:
         return self.data_exporter.export_to_json(self.leads_data, filename)
         
     def close(self):
-        """Close the WebDriver."""
-        self.driver.quit()
+        """Close all WebDrivers and the HTTP session."""
+        self.driver_pool.close()
+        self.session.close()
 
 
 # Example usage
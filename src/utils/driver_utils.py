@@ -0,0 +1,183 @@
+import queue
+import threading
+import functools
+from contextlib import contextmanager
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+# Resources blocked by default; only the DOM of each page is read
+DEFAULT_BLOCKED_URLS = [
+    '*.png', '*.jpg', '*.gif', '*.woff*', '*.css',
+    '*google-analytics*', '*doubleclick*'
+]
+
+@functools.lru_cache(maxsize=8)
+def _chrome_options(headless, extra_arguments):
+    """Build Chrome options, shared by every driver started with the same settings."""
+    chrome_options = Options()
+    
+    # Return from navigation once the DOM is ready instead of waiting for every asset
+    chrome_options.page_load_strategy = 'eager'
+    
+    # Apply headless mode if configured
+    if headless:
+        chrome_options.add_argument("--headless")
+        
+    # Add standard options
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    
+    # Skip image downloads; only the DOM is read
+    chrome_options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+    
+    # Add any custom options from config
+    for option in extra_arguments:
+        chrome_options.add_argument(option)
+        
+    return chrome_options
+
+def build_driver(config):
+    """
+    Start a Chrome WebDriver configured from scraper settings.
+    
+    Args:
+        config (dict): Scraper configuration
+        
+    Returns:
+        WebDriver: New Chrome driver
+    """
+    chrome_options = _chrome_options(
+        bool(config.get('headless', True)),
+        tuple(config.get('chrome_options', []))
+    )
+    
+    # Initialize the driver
+    driver = webdriver.Chrome(options=chrome_options)
+    
+    # Set default timeout
+    driver.implicitly_wait(config.get('timeout', 10))
+    
+    # Block images, fonts, stylesheets and trackers for every page this driver loads
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {
+            'urls': config.get('blocked_urls', DEFAULT_BLOCKED_URLS)
+        })
+    except Exception as e:
+        print(f"Could not configure resource blocking: {e}")
+        
+    return driver
+
+class DriverPool:
+    """
+    Utility class for sharing a fixed set of Selenium WebDrivers between threads.
+    """
+    
+    def __init__(self, size, driver_factory, recycle_after=50, acquire_timeout=300):
+        """
+        Initialize the pool and start all drivers up front.
+        
+        Args:
+            size (int): Number of drivers to keep
+            driver_factory (callable): Function returning a new WebDriver
+            recycle_after (int, optional): Page loads (see record_page) after which a driver
+                is replaced on release, to bound memory growth
+            acquire_timeout (float, optional): Seconds acquire() waits for a free driver
+        """
+        self.driver_factory = driver_factory
+        self.recycle_after = recycle_after
+        self.acquire_timeout = acquire_timeout
+        
+        self._available = queue.Queue()
+        self._pages_served = {}
+        self._lock = threading.Lock()
+        
+        try:
+            for _ in range(max(1, size)):
+                self._available.put(self._create_driver())
+        except Exception:
+            # Don't leave already started browsers running when the pool can't be built
+            self.close()
+            raise
+    
+    def _create_driver(self):
+        """Start a new driver and register it with the pool."""
+        driver = self.driver_factory()
+        with self._lock:
+            self._pages_served[driver] = 0
+        return driver
+    
+    def acquire(self):
+        """
+        Take a driver from the pool, blocking until one is free.
+        
+        Returns:
+            WebDriver: Driver reserved for the caller
+            
+        Raises:
+            TimeoutError: If no driver becomes free within acquire_timeout
+        """
+        try:
+            return self._available.get(timeout=self.acquire_timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No WebDriver became available within {self.acquire_timeout} seconds")
+    
+    def record_page(self, driver):
+        """
+        Count a page load towards a driver's recycle limit.
+        
+        Args:
+            driver (WebDriver): Driver that loaded the page
+        """
+        with self._lock:
+            if driver in self._pages_served:
+                self._pages_served[driver] += 1
+    
+    def release(self, driver):
+        """
+        Return a driver to the pool, replacing it if it has loaded too many pages.
+        
+        Args:
+            driver (WebDriver): Driver previously returned by acquire()
+        """
+        with self._lock:
+            worn_out = self.recycle_after and self._pages_served[driver] >= self.recycle_after
+        
+        if worn_out:
+            # Start the replacement before quitting the old driver, so a failed
+            # start keeps the old one in service and the pool never shrinks
+            try:
+                replacement = self._create_driver()
+            except Exception as e:
+                print(f"Could not recycle driver, keeping the old one: {e}")
+            else:
+                with self._lock:
+                    self._pages_served.pop(driver, None)
+                try:
+                    driver.quit()
+                except Exception as e:
+                    print(f"Error closing recycled driver: {e}")
+                driver = replacement
+        
+        self._available.put(driver)
+    
+    @contextmanager
+    def driver(self):
+        """Context manager that acquires a driver and releases it on exit."""
+        driver = self.acquire()
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+    
+    def close(self):
+        """Quit every driver owned by the pool."""
+        with self._lock:
+            drivers = list(self._pages_served)
+            self._pages_served = {}
+        
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                print(f"Error closing driver: {e}")
@@ -1,14 +1,78 @@
 import re
 import itertools
+import functools
+
+# Precompiled patterns
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', re.ASCII)
+_FIRSTINITIALLAST_RE = re.compile(r'^[a-z][a-z]{2,}$', re.ASCII)
+_DOMAIN_RE = re.compile(r'https?://(?:www\.)?([^/]+)', re.ASCII)
+
+@functools.lru_cache(maxsize=1024)
+def _detect_pattern(emails):
+    """
+    Detect the most common username pattern in a tuple of emails.
+    
+    Cached, since leads at the same company repeat the same known emails.
+    Order matters: ties go to the pattern counted first.
+    """
+    if not emails or len(emails) < 2:
+        return None
+        
+    # Extract domains and usernames
+    domains = set()
+    usernames = []
+    
+    for email in emails:
+        parts = email.split('@')
+        if len(parts) != 2:
+            continue
+            
+        username, domain = parts
+        domains.add(domain)
+        usernames.append(username)
+        
+    # If multiple domains, can't determine a pattern
+    if len(domains) != 1:
+        return None
+        
+    # Analyze username patterns
+    patterns = []
+    for username in usernames:
+        if '.' in username:
+            pattern = "first.last"
+        elif '_' in username:
+            pattern = "first_last"
+        elif len(username) <= 2:
+            pattern = "initials"
+        else:
+            # Check if it's first initial + last name
+            if _FIRSTINITIALLAST_RE.match(username):
+                pattern = "firstinitiallast"
+            else:
+                pattern = "unknown"
+        
+        patterns.append(pattern)
+        
+    # Count pattern frequencies
+    pattern_counts = {}
+    for pattern in patterns:
+        pattern_counts[pattern] = pattern_counts.get(pattern, 0) + 1
+        
+    # Find most common pattern
+    most_common = max(pattern_counts.items(), key=lambda x: x[1])
+    
+    return most_common[0]
 
 class EmailExtractor:
     """
     Utility class for extracting and generating email addresses.
     """
     
+    __slots__ = ('email_pattern', 'email_formats')
+    
     def __init__(self):
         # Standard email pattern
-        self.email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+        self.email_pattern = _EMAIL_RE
         
         # Common email formats for generation
         self.email_formats = [
@@ -34,7 +98,7 @@ class EmailExtractor:
         if not text:
             return []
             
-        return list(set(re.findall(self.email_pattern, text)))
+        return list(set(_EMAIL_RE.findall(text)))
     
     def extract_email_from_text(self, text):
         """
@@ -59,55 +123,10 @@ class EmailExtractor:
         Returns:
             str or None: Detected email pattern or None
         """
-        if not emails or len(emails) < 2:
-            return None
-            
-        # Extract domains and usernames
-        domains = set()
-        usernames = []
-        
-        for email in emails:
-            parts = email.split('@')
-            if len(parts) != 2:
-                continue
-                
-            username, domain = parts
-            domains.add(domain)
-            usernames.append(username)
-            
-        # If multiple domains, can't determine a pattern
-        if len(domains) != 1:
+        if not emails:
             return None
             
-        domain = list(domains)[0]
-        
-        # Analyze username patterns
-        patterns = []
-        for username in usernames:
-            if '.' in username:
-                pattern = "first.last"
-            elif '_' in username:
-                pattern = "first_last"
-            elif len(username) <= 2:
-                pattern = "initials"
-            else:
-                # Check if it's first initial + last name
-                if re.match(r'^[a-z][a-z]{2,}$', username):
-                    pattern = "firstinitiallast"
-                else:
-                    pattern = "unknown"
-            
-            patterns.append(pattern)
-            
-        # Count pattern frequencies
-        pattern_counts = {}
-        for pattern in patterns:
-            pattern_counts[pattern] = pattern_counts.get(pattern, 0) + 1
-            
-        # Find most common pattern
-        most_common = max(pattern_counts.items(), key=lambda x: x[1])
-        
-        return most_common[0]
+        return _detect_pattern(tuple(emails))
     
     def generate_likely_email(self, name, company_name, company_website, known_emails=None):
         """
@@ -126,7 +145,7 @@ class EmailExtractor:
             return None
             
         # Extract domain from website
-        domain_match = re.search(r'https?://(?:www\.)?([^/]+)', company_website)
+        domain_match = _DOMAIN_RE.search(company_website)
         if not domain_match:
             return None
             
@@ -1,29 +1,284 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 import re
 import time
-import random
+import threading
 from urllib.parse import urljoin, urlparse
 
+# selectolax is optional; BeautifulSoup is used when it is missing
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
+# requests-cache is optional; without it sessions are not cached
+try:
+    from requests_cache import CachedSession
+    from requests_cache.policy import DEFAULT_IGNORED_PARAMS
+except ImportError:
+    CachedSession = None
+    DEFAULT_IGNORED_PARAMS = ()
+
+# Hyperscan is optional; without it every pattern is scanned with `re`
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Precompiled patterns for contact information
+_EMAIL_PATTERN = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+
+# Email pattern that rejects placeholder domains and image names (e.g. logo.png@2x.jpg) during the scan
+_EMAIL_RE = re.compile(
+    r'(?<![a-zA-Z0-9._%+-])'
+    r'(?![^@\s]*\.(?:jpg|png|gif)@)'
+    r'(?![^@\s]*@(?:example|domain|email))'
+    + _EMAIL_PATTERN,
+    re.ASCII
+)
+# Hyperscan scans bytes, so its email hits are checked against a bytes copy of _EMAIL_RE
+_EMAIL_BYTES_RE = re.compile(_EMAIL_RE.pattern.encode(), re.ASCII)
+_PHONE_RE = re.compile(r'(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', re.ASCII)
+_NON_DIGIT_RE = re.compile(r'\D', re.ASCII)
+_QUERY_RE = re.compile(r'\?.*$')
+
+# Tracking parameters excluded from cache keys so otherwise identical URLs share an entry
+_TRACKING_PARAMS = [
+    'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
+    'ref', 'fbclid', 'gclid'
+]
+
+def create_session(headers=None, cache_name=None, expire_after=None):
+    """
+    Create a requests session with a pooled, retrying adapter.
+    
+    Args:
+        headers (dict, optional): Default headers for every request
+        cache_name (str, optional): SQLite cache path; enables response caching when requests-cache is installed
+        expire_after (datetime.timedelta, optional): Lifetime of cached responses
+        
+    Returns:
+        requests.Session: Configured session
+    """
+    if cache_name and CachedSession is not None:
+        session = CachedSession(
+            cache_name,
+            backend='sqlite',
+            expire_after=expire_after,
+            allowable_methods=['GET'],
+            # Keep the default credential params redacted and out of the key as well
+            ignored_parameters=list(DEFAULT_IGNORED_PARAMS) + _TRACKING_PARAMS,
+            stale_if_error=True
+        )
+    else:
+        session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+        
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=Retry(total=2, backoff_factor=0.3))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    
+    return session
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter shared between threads.
+    
+    Calls go through immediately while tokens are available; once the
+    bucket is empty each caller sleeps only until its own slot comes up.
+    """
+    
+    def __init__(self, max_calls=2, period=1.0):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            max_calls (float, optional): Calls allowed per period, also the burst size
+                (at least 1); 0 or less disables limiting
+            period (float, optional): Length of the period in seconds
+        """
+        if max_calls > 0 and period <= 0:
+            raise ValueError("period must be positive")
+            
+        self.max_calls = max_calls
+        self.period = period
+        
+        # A fractional rate still has to let one call through at a time
+        self._capacity = max(1.0, max_calls)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        
+    def acquire(self):
+        """Block until a call is allowed."""
+        if self.max_calls <= 0:
+            return
+            
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self.max_calls / self.period)
+            self._updated = now
+            
+            # Reserve a token; a negative balance is the queue of waiting callers
+            self._tokens -= 1
+            wait = -self._tokens * self.period / self.max_calls if self._tokens < 0 else 0
+            
+        if wait > 0:
+            time.sleep(wait)
+            
+    def __enter__(self):
+        self.acquire()
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+def _is_cached(session, url):
+    """Whether a GET for url would be answered from a fresh requests-cache entry."""
+    cache = getattr(session, 'cache', None)
+    if cache is None:
+        return False
+        
+    try:
+        response = cache.get_response(cache.create_key(requests.Request('GET', url)))
+    except Exception:
+        return False
+        
+    return response is not None and not response.is_expired
+
+def throttled_get(session, rate_limiter, url, **kwargs):
+    """
+    GET a URL, waiting on the rate limiter only for real network fetches.
+    
+    Responses served from the session's cache return immediately.
+    
+    Args:
+        session (requests.Session): Session to send the request with
+        rate_limiter (RateLimiter): Limiter for network requests
+        url (str): URL to fetch
+        **kwargs: Passed on to session.get
+        
+    Returns:
+        requests.Response: Response
+    """
+    if _is_cached(session, url):
+        return session.get(url, **kwargs)
+        
+    with rate_limiter:
+        return session.get(url, **kwargs)
+
+def _leftmost_longest(spans):
+    """
+    Reduce Hyperscan match reports to the matches `re.findall` would return.
+    
+    Hyperscan reports every end offset of a pattern, each with its leftmost
+    start; keep the longest span per start and drop spans overlapping an
+    earlier one.
+    
+    Args:
+        spans (list): (start, end) offsets reported by Hyperscan
+        
+    Returns:
+        list: Non-overlapping (start, end) offsets in text order
+    """
+    longest = {}
+    for start, end in spans:
+        if end > longest.get(start, -1):
+            longest[start] = end
+            
+    matches = []
+    last_end = -1
+    for start in sorted(longest):
+        if start >= last_end:
+            matches.append((start, longest[start]))
+            last_end = longest[start]
+            
+    return matches
+
+def parse_html(markup):
+    """
+    Parse HTML with selectolax when available, otherwise BeautifulSoup.
+    
+    Args:
+        markup (str or bytes): HTML document
+        
+    Returns:
+        Parsed document to pass to select_links
+    """
+    if HTMLParser is not None:
+        return HTMLParser(markup)
+    return BeautifulSoup(markup, 'html.parser')
+
+def select_links(tree, selector='a[href]'):
+    """
+    Yield the href and text of each element matching a CSS selector.
+    
+    Args:
+        tree: Document returned by parse_html
+        selector (str, optional): CSS selector for link elements
+        
+    Yields:
+        tuple: (href, text) for each matching element
+    """
+    if HTMLParser is not None:
+        for node in tree.css(selector):
+            yield node.attributes.get('href') or '', node.text(strip=True)
+    else:
+        for node in tree.select(selector):
+            yield node.get('href') or '', node.get_text(strip=True)
+
+def extract_text(tree):
+    """
+    Return the visible text of a parsed document.
+    
+    Script, style and noscript contents are removed from the tree first,
+    so call select_links beforehand if links are needed as well.
+    
+    Args:
+        tree: Document returned by parse_html
+        
+    Returns:
+        str: Text content separated by spaces
+    """
+    if HTMLParser is not None:
+        tree.strip_tags(['script', 'style', 'noscript'])
+        return tree.body.text(separator=' ') if tree.body else ''
+        
+    for node in tree(['script', 'style', 'noscript']):
+        node.decompose()
+    return tree.get_text(' ')
+
 class WebsiteAnalyzer:
     """
     Utility class for analyzing websites and extracting contact information.
     """
     
-    def __init__(self, headers=None):
+    __slots__ = (
+        'headers', 'session', 'rate_limiter', 'email_pattern', 'phone_pattern',
+        'social_patterns', 'contact_keywords', '_social_res', '_hs_db'
+    )
+    
+    def __init__(self, headers=None, session=None, rate_limiter=None):
         """
         Initialize the website analyzer.
         
         Args:
             headers (dict, optional): Request headers
+            session (requests.Session, optional): Shared session for connection reuse
+            rate_limiter (RateLimiter, optional): Shared limiter for outgoing requests
         """
         self.headers = headers or {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        self.session = session or create_session(self.headers)
+        self.rate_limiter = rate_limiter or RateLimiter()
         
         # Define patterns for contact information
-        self.email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        self.phone_pattern = r'(\+\d{1,3}[-.\s]?)?(\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})'
+        self.email_pattern = _EMAIL_RE
+        self.phone_pattern = _PHONE_RE
         
         # Social media patterns
         self.social_patterns = {
@@ -33,6 +288,10 @@ class WebsiteAnalyzer:
             "instagram": r'instagram\.com/([^/"\s]+)',
             "youtube": r'youtube\.com/(?:channel|user|c)/([^/"\s]+)'
         }
+        self._social_res = [(platform, re.compile(pattern)) for platform, pattern in self.social_patterns.items()]
+        
+        # Multi-pattern database used to scan each page in a single pass
+        self._hs_db = self._build_hyperscan_db() if hyperscan else None
         
         # Contact page keywords
         self.contact_keywords = ['contact', 'about', 'team', 'connect', 'reach', 'support']
@@ -56,56 +315,149 @@ class WebsiteAnalyzer:
             "social_media": {}
         }
         
+        # Deduplicate as pages are read, keeping first-seen order
+        seen_emails = {}
+        seen_phones = {}
+        
         try:
             # Get the main page
             response = self._make_request(website_url)
             if not response:
                 return contact_info
                 
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Extract emails from main page
-            emails = self._extract_emails(response.text)
-            contact_info["emails"].extend(emails)
-            
-            # Extract phone numbers from main page
-            phone_numbers = self._extract_phone_numbers(response.text)
-            contact_info["phone_numbers"].extend(phone_numbers)
-            
-            # Extract social media links
-            social_media = self._extract_social_media(response.text)
-            contact_info["social_media"].update(social_media)
+            # Extract emails, phone numbers and social media links from main page
+            page_info, links = self._analyze_page(response.content)
+            self._merge_page_info(page_info, seen_emails, seen_phones, contact_info["social_media"])
             
             # Find and analyze contact pages
-            contact_links = self._find_contact_pages(website_url, soup)
+            contact_links = self._find_contact_pages(website_url, links)
             
             for link in contact_links[:3]:  # Limit to first 3 contact pages for efficiency
                 contact_page_info = self._analyze_contact_page(link)
+                self._merge_page_info(contact_page_info, seen_emails, seen_phones, contact_info["social_media"])
                 
-                contact_info["emails"].extend(contact_page_info.get("emails", []))
-                contact_info["phone_numbers"].extend(contact_page_info.get("phone_numbers", []))
-                
-                if contact_page_info.get("social_media"):
-                    for platform, handle in contact_page_info["social_media"].items():
-                        if platform not in contact_info["social_media"]:
-                            contact_info["social_media"][platform] = handle
-            
-            # Remove duplicates
-            contact_info["emails"] = list(set(contact_info["emails"]))
-            contact_info["phone_numbers"] = list(set([self._format_phone_number(phone) for phone in contact_info["phone_numbers"]]))
-            
         except Exception as e:
             print(f"Error analyzing website {website_url}: {e}")
             
+        contact_info["emails"] = list(seen_emails)
+        contact_info["phone_numbers"] = list(seen_phones)
+        
         return contact_info
     
+    def _merge_page_info(self, page_info, seen_emails, seen_phones, social_media):
+        """Merge one page's contact information into the running results."""
+        seen_emails.update(dict.fromkeys(page_info.get("emails", [])))
+        
+        for phone in page_info.get("phone_numbers", []):
+            seen_phones.setdefault(self._format_phone_number(phone), None)
+            
+        # Earlier pages win for social media handles
+        for platform, handle in page_info.get("social_media", {}).items():
+            social_media.setdefault(platform, handle)
+    
+    def _build_hyperscan_db(self):
+        """Compile the email, phone and social media patterns into one Hyperscan database."""
+        # Hyperscan has no lookaround support, so emails match the plain pattern
+        # and the rejection rules are checked per hit in _scan
+        expressions = [_EMAIL_PATTERN, _PHONE_RE.pattern] + [pattern.pattern for _, pattern in self._social_res]
+        expressions = [expression.encode() for expression in expressions]
+        
+        # Emails and phones report match spans; social patterns only need to
+        # report that they occur, since their handles come from `re` groups
+        flags = [hyperscan.HS_FLAG_SOM_LEFTMOST] * 2 + [hyperscan.HS_FLAG_SINGLEMATCH] * len(self._social_res)
+        
+        try:
+            db = hyperscan.Database()
+            db.compile(
+                expressions=expressions,
+                ids=list(range(len(expressions))),
+                elements=len(expressions),
+                flags=flags
+            )
+            return db
+        except Exception as e:
+            print(f"Hyperscan unavailable, falling back to re: {e}")
+            return None
+    
+    def _analyze_page(self, content):
+        """
+        Parse a page once and extract its contact information.
+        
+        Emails and phone numbers are searched in the visible text plus link
+        targets (for mailto: and tel: links); social media handles only in
+        link targets. Script and style contents are never scanned.
+        
+        Args:
+            content (bytes): Raw page body
+            
+        Returns:
+            tuple: (contact information dict, list of (href, text) links)
+        """
+        tree = parse_html(content)
+        links = list(select_links(tree))
+        
+        hrefs = ' '.join(href for href, _ in links)
+        text = extract_text(tree) + ' ' + hrefs
+        
+        return self._scan(text, hrefs), links
+    
+    def _scan(self, text, links=None):
+        """
+        Extract emails, phone numbers and social media handles from page text.
+        
+        With Hyperscan available, emails and phone numbers come straight from
+        a single scan of the UTF-8 encoded text; `re` is only run for the
+        social media platforms that scan found. Social media handles are
+        taken from `links` when given.
+        """
+        if not text:
+            return {"emails": [], "phone_numbers": [], "social_media": {}}
+            
+        if links is None:
+            links = text
+            
+        if self._hs_db is None:
+            return {
+                "emails": self._extract_emails(text),
+                "phone_numbers": self._extract_phone_numbers(text),
+                "social_media": self._extract_social_media(links)
+            }
+            
+        email_spans = []
+        phone_spans = []
+        hits = set()
+        
+        def on_match(pattern_id, start, end, flags, context):
+            if pattern_id == 0:
+                email_spans.append((start, end))
+            elif pattern_id == 1:
+                phone_spans.append((start, end))
+            else:
+                hits.add(pattern_id)
+                
+        # Hyperscan only accepts bytes; offsets below refer to the encoded text
+        data = text.encode('utf-8', 'ignore')
+        self._hs_db.scan(data, match_event_handler=on_match)
+        
+        emails = [
+            data[start:end].decode('ascii')
+            for start, end in _leftmost_longest(email_spans)
+            if _EMAIL_BYTES_RE.fullmatch(data, start, end)
+        ]
+        phone_numbers = [data[start:end].decode('ascii') for start, end in _leftmost_longest(phone_spans)]
+        platforms = {platform for index, (platform, _) in enumerate(self._social_res, start=2) if index in hits}
+        
+        return {
+            "emails": list(dict.fromkeys(emails)),
+            "phone_numbers": phone_numbers,
+            "social_media": self._extract_social_media(links, platforms) if platforms else {}
+        }
+    
     def _make_request(self, url, timeout=10):
         """Make an HTTP request with error handling and rate limiting."""
         try:
-            # Add random delay to avoid detection
-            time.sleep(random.uniform(0.5, 2))
-            
-            response = requests.get(url, headers=self.headers, timeout=timeout)
+            # Throttle requests to avoid detection
+            response = throttled_get(self.session, self.rate_limiter, url, headers=self.headers, timeout=timeout)
             
             if response.status_code == 200:
                 return response
@@ -117,50 +469,23 @@ class WebsiteAnalyzer:
             return None
     
     def _extract_emails(self, text):
-        """Extract email addresses from text."""
+        """Extract email addresses from text, skipping common false positives."""
         if not text:
             return []
             
-        # Find all email addresses
-        emails = re.findall(self.email_pattern, text)
-        
-        # Filter out likely invalid emails
-        filtered_emails = []
-        for email in emails:
-            # Skip common false positives
-            if '@example' in email or '@domain' in email or '@email' in email:
-                continue
-                
-            # Skip image URLs that might contain @ symbols
-            if '.jpg@' in email or '.png@' in email or '.gif@' in email:
-                continue
-                
-            filtered_emails.append(email)
-            
-        return filtered_emails
+        return list(dict.fromkeys(_EMAIL_RE.findall(text)))
     
     def _extract_phone_numbers(self, text):
         """Extract phone numbers from text."""
         if not text:
             return []
             
-        # Find potential phone numbers
-        matches = re.findall(self.phone_pattern, text)
-        
-        # Process matches to get full phone numbers
-        phone_numbers = []
-        for match in matches:
-            if len(match) >= 2:
-                # Combine country code and local number if both exist
-                phone = ''.join(part for part in match if part)
-                phone_numbers.append(phone)
-            
-        return phone_numbers
+        return _PHONE_RE.findall(text)
     
     def _format_phone_number(self, phone):
         """Format a phone number consistently."""
         # Remove all non-digit characters
-        digits = re.sub(r'\D', '', phone)
+        digits = _NON_DIGIT_RE.sub('', phone)
         
         # Format based on length
         if len(digits) == 10:
@@ -170,16 +495,57 @@ class WebsiteAnalyzer:
         else:
             return phone  # Return original if can't format consistently
     
-    def _extract_social_media(self, text):
-        """Extract social media handles from text."""
+    def _extract_social_media(self, text, platforms=None):
+        """Extract social media handles from text, optionally only for the given platforms."""
         social_media = {}
         
-        for platform, pattern in self.social_patterns.items():
-            matches = re.findall(pattern, text)
+        for platform, pattern in self._social_res:
+            if platforms is not None and platform not in platforms:
+                continue
+                
+            matches = pattern.findall(text)
             if matches:
                 # Use the first match
                 handle = matches[0]
                 
                 # Clean up handle
                 handle = handle.strip('/')
-                handle = re.sub(r'\?.*$', '',
+                handle = _QUERY_RE.sub('', handle)
+                
+                social_media[platform] = handle
+                
+        return social_media
+    
+    def _find_contact_pages(self, base_url, links):
+        """Find links to contact-related pages on the same domain."""
+        base_domain = urlparse(base_url).netloc
+        contact_links = []
+        
+        for href, link_text in links:
+            if not href:
+                continue
+                
+            link_text = link_text.lower()
+            
+            if not any(keyword in href.lower() or keyword in link_text for keyword in self.contact_keywords):
+                continue
+                
+            full_url = urljoin(base_url, href)
+            
+            # Stay on the company's own domain
+            if urlparse(full_url).netloc != base_domain:
+                continue
+                
+            if full_url not in contact_links and full_url.rstrip('/') != base_url.rstrip('/'):
+                contact_links.append(full_url)
+                
+        return contact_links
+    
+    def _analyze_contact_page(self, url):
+        """Extract contact information from a single contact page."""
+        response = self._make_request(url)
+        if not response:
+            return {}
+            
+        page_info, _ = self._analyze_page(response.content)
+        return page_info